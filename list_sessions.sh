@@ -4,11 +4,24 @@
 echo "Blog Generation Sessions"
 echo "========================"
 
-for session in generations/*/; do
-    if [ -f "$session/metadata.json" ]; then
-        echo ""
-        echo "📁 $(basename $session)"
-        # Use ripgrep to extract key fields
-        rg '"topic":|"created_at":|"final_selection":' "$session/metadata.json" | sed 's/^/  /'
-    fi
-done
+shopt -s nullglob
+metadata_files=(generations/*/metadata.json)
+[ ${#metadata_files[@]} -eq 0 ] && exit 0
+
+# Use a single ripgrep pass over every session's metadata, grouped by session.
+# awk reads the session list first so every session gets a header, even with no matching fields.
+rg --with-filename --no-heading '"topic":|"created_at":|"final_selection":' "${metadata_files[@]}" |
+    awk '
+        NR == FNR { files[++n] = $0; next }
+        {
+            file = $0; sub(/:.*/, "", file)
+            line = $0; sub(/^[^:]*:/, "", line)
+            lines[file] = lines[file] "  " line "\n"
+        }
+        END {
+            for (i = 1; i <= n; i++) {
+                count = split(files[i], parts, "/")
+                printf "\n📁 %s\n%s", parts[count - 1], lines[files[i]]
+            }
+        }
+    ' <(printf '%s\n' "${metadata_files[@]}") -
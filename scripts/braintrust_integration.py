@@ -7,6 +7,7 @@ Provides evaluation tracking and experiment logging
 import os
 import json
 import time
+import functools
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from pathlib import Path
@@ -378,6 +379,19 @@ class BraintrustEvaluator:
 
 
 # Integration helper functions
+@functools.lru_cache(maxsize=None)
+def _disabled_tracker(project_name: str) -> BraintrustTracker:
+    """Build the (inert) tracker used when no API key is set, once per project"""
+    return BraintrustTracker(project_name)
+
+
+def get_tracker(project_name: str = "evo-blog-generator") -> BraintrustTracker:
+    """Return a tracker, reusing a shared disabled instance when BRAINTRUST_API_KEY is unset"""
+    if os.getenv('BRAINTRUST_API_KEY'):
+        return BraintrustTracker(project_name)
+    return _disabled_tracker(project_name)
+
+
 def setup_braintrust_for_blog_generator(api_key: str = None) -> bool:
     """Setup Braintrust for the blog generator"""
     
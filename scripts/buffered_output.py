@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Per-thread stdout buffering for test scripts
+Lets independent tests run concurrently without interleaving their output
+"""
+
+import io
+import sys
+import threading
+from contextlib import contextmanager
+
+_thread_output = threading.local()
+
+
+class ThreadStdout:
+    """stdout proxy that sends a worker thread's writes to its own buffer"""
+    
+    def __init__(self, stream):
+        self._stream = stream
+    
+    def write(self, text):
+        return getattr(_thread_output, 'buffer', self._stream).write(text)
+    
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+@contextmanager
+def thread_buffered_stdout():
+    """Route sys.stdout through ThreadStdout for the duration of the block"""
+    original_stdout = sys.stdout
+    sys.stdout = ThreadStdout(original_stdout)
+    try:
+        yield original_stdout
+    finally:
+        sys.stdout = original_stdout
+
+
+def run_buffered(func, *args):
+    """Run func(*args) in the current thread, returning (result, captured output)"""
+    buffer = _thread_output.buffer = io.StringIO()
+    try:
+        return func(*args), buffer.getvalue()
+    finally:
+        del _thread_output.buffer
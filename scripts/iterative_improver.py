@@ -164,7 +164,7 @@ class IterativeImprover:
         if iteration == 1:
             # First iteration: generate based on style analysis
             prompt_variations = self.prompt_generator.generate_iterative_improvements(
-                style_analysis, iteration=iteration
+                style_analysis, iteration=iteration, run_timestamp=self.run_id
             )
         else:
             # Later iterations: use feedback from previous iteration
@@ -177,7 +177,8 @@ class IterativeImprover:
                 "structural_match": 0.55
             }
             prompt_variations = self.prompt_generator.generate_iterative_improvements(
-                style_analysis, {"performance_scores": performance_feedback}, iteration
+                style_analysis, {"performance_scores": performance_feedback}, iteration,
+                run_timestamp=self.run_id
             )
         
         print(f"      Generated {len(prompt_variations)} variations")
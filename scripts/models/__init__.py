@@ -3,11 +3,18 @@ Model integration module for blog post generation
 Provides unified interface for all AI models
 """
 
+import importlib
+
 from .base import ModelClient, ModelResponse
-from .claude_client import ClaudeClient
-from .openai_client import OpenAIClient
-from .gemini_client import GeminiClient
-from .local_client import LocalClient
+
+# Provider clients are imported on first access so that using one provider
+# doesn't import every vendor SDK
+_LAZY_CLIENTS = {
+    'ClaudeClient': '.claude_client',
+    'OpenAIClient': '.openai_client',
+    'GeminiClient': '.gemini_client',
+    'LocalClient': '.local_client'
+}
 
 __all__ = [
     'ModelClient',
@@ -16,4 +23,12 @@ __all__ = [
     'OpenAIClient',
     'GeminiClient',
     'LocalClient'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name in _LAZY_CLIENTS:
+        client_class = getattr(importlib.import_module(_LAZY_CLIENTS[name], __name__), name)
+        globals()[name] = client_class
+        return client_class
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
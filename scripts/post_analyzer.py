@@ -38,17 +38,17 @@ class BlogPost:
     conclusion_type: str
 
 
-@dataclass
+@dataclass(frozen=True)
 class StyleAnalysis:
-    """Analysis of writing style patterns"""
+    """Analysis of writing style patterns (immutable so it can key prompt caches)"""
     avg_paragraph_length: float
     avg_sentence_length: float
     data_points_per_post: float
-    common_transitions: List[str]
-    hook_patterns: List[str]
-    conclusion_patterns: List[str]
-    voice_characteristics: List[str]
-    topic_distribution: Dict[str, int]
+    common_transitions: Tuple[str, ...]
+    hook_patterns: Tuple[str, ...]
+    conclusion_patterns: Tuple[str, ...]
+    voice_characteristics: Tuple[str, ...]
+    topic_distribution: Tuple[Tuple[str, int], ...]
 
 
 class PostAnalyzer:
@@ -235,7 +235,7 @@ Companies that treat their data teams as strategic revenue partners rather than
         """Extract overall style patterns from analyzed posts"""
         
         if not posts:
-            return StyleAnalysis(0, 0, 0, [], [], [], [], {})
+            return StyleAnalysis(0, 0, 0, (), (), (), (), ())
         
         # Calculate averages
         avg_paragraph_length = sum(p.word_count / p.paragraph_count for p in posts if p.paragraph_count > 0) / len(posts)
@@ -243,10 +243,10 @@ Companies that treat their data teams as strategic revenue partners rather than
         avg_data_points = sum(len(p.data_points) for p in posts) / len(posts)
         
         # Extract common patterns
-        common_transitions = ["However", "More importantly", "The transformation", "This approach", "Consider how"]
-        hook_patterns = ["question_opening", "bold_statement", "trend_observation"]
-        conclusion_patterns = ["future_prediction", "competitive_advantage", "transformation_summary"]
-        voice_characteristics = ["analytical", "data-driven", "practical", "forward-looking", "confident"]
+        common_transitions = ("However", "More importantly", "The transformation", "This approach", "Consider how")
+        hook_patterns = ("question_opening", "bold_statement", "trend_observation")
+        conclusion_patterns = ("future_prediction", "competitive_advantage", "transformation_summary")
+        voice_characteristics = ("analytical", "data-driven", "practical", "forward-looking", "confident")
         
         # Topic distribution
         topic_distribution = {}
@@ -262,7 +262,7 @@ Companies that treat their data teams as strategic revenue partners rather than
             hook_patterns=hook_patterns,
             conclusion_patterns=conclusion_patterns,
             voice_characteristics=voice_characteristics,
-            topic_distribution=topic_distribution
+            topic_distribution=tuple(topic_distribution.items())
         )
     
     def analyze_posts(self, count: int = 20) -> StyleAnalysis:
@@ -332,7 +332,7 @@ Companies that treat their data teams as strategic revenue partners rather than
         print(f"✅ Analysis complete: {len(self.posts)} posts analyzed")
         print(f"   📊 Avg paragraph length: {self.analysis.avg_paragraph_length:.1f} words")
         print(f"   📊 Avg data points per post: {self.analysis.data_points_per_post:.1f}")
-        print(f"   📊 Top topics: {list(self.analysis.topic_distribution.keys())[:3]}")
+        print(f"   📊 Top topics: {[topic for topic, _ in self.analysis.topic_distribution[:3]]}")
         
         return self.analysis
     
@@ -368,7 +368,7 @@ Companies that treat their data teams as strategic revenue partners rather than
                 "hook_patterns": self.analysis.hook_patterns,
                 "conclusion_patterns": self.analysis.conclusion_patterns,
                 "voice_characteristics": self.analysis.voice_characteristics,
-                "topic_distribution": self.analysis.topic_distribution
+                "topic_distribution": dict(self.analysis.topic_distribution)
             }
         }
         
@@ -393,7 +393,7 @@ def main():
     print(f"Average paragraph length: {analysis.avg_paragraph_length:.1f} words")
     print(f"Average data points per post: {analysis.data_points_per_post:.1f}")
     print(f"Common voice characteristics: {', '.join(analysis.voice_characteristics[:3])}")
-    print(f"Topic distribution: {analysis.topic_distribution}")
+    print(f"Topic distribution: {dict(analysis.topic_distribution)}")
 
 
 if __name__ == "__main__":
@@ -6,12 +6,17 @@ Generates improved prompts based on analysis of published posts and AI performan
 
 import os
 import sys
-import json
+import itertools
+import mmap
 import re
-from datetime import datetime
+import time
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -20,7 +25,11 @@ from post_analyzer import StyleAnalysis, PostAnalyzer
 from braintrust_integration import BraintrustTracker
 
 
-@dataclass
+# Matches the style guide literal in generate_blog_post.py
+_STYLE_RE = re.compile(rb'style_guide\s*=\s*"""(.*?)"""', re.DOTALL)
+
+
+@dataclass(slots=True)
 class PromptVariation:
     """Represents a prompt variation for testing"""
     name: str
@@ -29,6 +38,165 @@ class PromptVariation:
     target_improvements: List[str]
     expected_score_improvement: float
     version: str
+    token_count: int = 0
+
+
+# Gap thresholds for style analysis and performance feedback
+MIN_PARAGRAPH_LENGTH = 30
+MAX_PARAGRAPH_LENGTH = 60
+MIN_DATA_POINTS = 2
+LOW_SCORE_THRESHOLD = 0.7
+
+# Voice characteristics the base prompt is expected to mention. Matching is by
+# substring, like `keyword in prompt.lower()`, so "analytically" counts as "analytical"
+VOICE_KEYWORDS = ("analytical", "data-driven", "practical", "forward-looking")
+_VOICE_KEYWORDS_RE = re.compile("|".join(re.escape(keyword) for keyword in VOICE_KEYWORDS))
+
+
+def _numeric_gaps(avg_paragraph_length: float, data_points_per_post: float) -> Tuple[str, ...]:
+    """Gaps from the numeric style metrics, checked against the threshold constants"""
+    gaps = []
+    
+    if avg_paragraph_length < MIN_PARAGRAPH_LENGTH:
+        gaps.append("paragraphs_too_short")
+    elif avg_paragraph_length > MAX_PARAGRAPH_LENGTH:
+        gaps.append("paragraphs_too_long")
+    
+    if data_points_per_post < MIN_DATA_POINTS:
+        gaps.append("insufficient_data_points")
+    
+    return tuple(gaps)
+
+
+# Prompt builders are keyed by (base_prompt, frozen StyleAnalysis), so repeated
+# iterations over the same analysis reuse the formatted text
+@lru_cache(maxsize=32)
+def _build_enhanced_data_prompt(base_prompt: str, style_analysis: StyleAnalysis) -> str:
+    """Create prompt with enhanced data integration"""
+    
+    data_emphasis = f"""
+CRITICAL DATA REQUIREMENTS:
+- MUST include exactly {int(style_analysis.data_points_per_post)} specific data points or statistics
+- Use real company examples with specific metrics (revenue, growth rates, user counts)
+- Include percentages, dollar amounts, or quantified comparisons
+- Examples: "Klarna reduced costs by 66%", "ARR grew from $10M to $50M", "conversion rates improved 3x"
+- If you don't know exact figures, use [NEEDS DATA: description] placeholders
+- Prefer recent data from 2024-2025 when possible
+"""
+    
+    return "".join((base_prompt, data_emphasis))
+
+
+@lru_cache(maxsize=32)
+def _build_structured_flow_prompt(base_prompt: str, style_analysis: StyleAnalysis) -> str:
+    """Create prompt with improved structure and flow"""
+    
+    target_para_length = int(style_analysis.avg_paragraph_length)
+    transitions = ', '.join(style_analysis.common_transitions[:3])
+    
+    structure_emphasis = f"""
+ENHANCED STRUCTURE REQUIREMENTS:
+- Target paragraph length: {target_para_length} words per paragraph
+- Use these specific transition patterns: {transitions}
+- First paragraph: Bold declarative statement (1 sentence, under 10 words)
+- Second paragraph: Thought-provoking question or contrarian observation
+- Body paragraphs: Mix of 2-sentence and 3-sentence paragraphs for rhythm
+- Each paragraph must flow logically to the next with clear connective tissue
+- Conclusion: Forward-looking statement that reinforces the main insight
+"""
+    
+    return "".join((base_prompt, structure_emphasis))
+
+
+@lru_cache(maxsize=32)
+def _build_voice_enhanced_prompt(base_prompt: str, style_analysis: StyleAnalysis) -> str:
+    """Create prompt with enhanced Tom Tunguz voice"""
+    
+    voice_emphasis = f"""
+TOM TUNGUZ VOICE AMPLIFICATION:
+- Channel these specific characteristics: {', '.join(style_analysis.voice_characteristics)}
+- Write with analytical confidence - state insights as facts, not opinions
+- Use present tense for trends: "Companies are discovering..." not "Companies will discover..."
+- Include practical implications: "This means..." or "The result is..."
+- Avoid hedge words: "perhaps", "maybe", "could be"
+- Write as an industry insider with deep expertise
+- Balance optimism about technology with practical business realities
+- Reference specific companies and real examples, not hypothetical scenarios
+"""
+    
+    return "".join((base_prompt, voice_emphasis))
+
+
+@lru_cache(maxsize=32)
+def _build_topic_optimized_prompt(base_prompt: str, style_analysis: StyleAnalysis,
+                                  topics: Tuple[str, ...]) -> str:
+    """Create prompt optimized for specific topics"""
+    
+    topic_guidance = {}
+    
+    if "SaaS" in topics:
+        topic_guidance["SaaS"] = "Focus on metrics like ARR, churn, LTV/CAC, expansion revenue. Reference successful SaaS companies and their growth strategies."
+    
+    if "AI" in topics:
+        topic_guidance["AI"] = "Emphasize practical business applications, not theoretical capabilities. Include real implementation examples and measurable business impact."
+    
+    if "data" in topics:
+        topic_guidance["data"] = "Focus on actionable insights and business outcomes. Avoid technical jargon in favor of business impact and ROI."
+    
+    guidance_lines = "\n".join(f"- {topic}: {guidance}" for topic, guidance in topic_guidance.items())
+    
+    topic_emphasis = f"""
+TOPIC-SPECIFIC GUIDANCE:
+{guidance_lines}
+
+INDUSTRY CONTEXT:
+- Assume audience of founders, VCs, and business leaders
+- Focus on practical applications and business impact
+- Include relevant market sizing and trend data when available
+"""
+    
+    return "".join((base_prompt, topic_emphasis))
+
+
+@lru_cache(maxsize=32)
+def _build_comprehensive_prompt(base_prompt: str, style_analysis: StyleAnalysis) -> str:
+    """Create comprehensive prompt addressing all gaps"""
+    
+    data_points = int(style_analysis.data_points_per_post)
+    target_para_length = int(style_analysis.avg_paragraph_length)
+    transitions = ', '.join(style_analysis.common_transitions[:2])
+    
+    # Combine all enhancements
+    comprehensive_additions = f"""
+COMPREHENSIVE OPTIMIZATION (Version C):
+
+DATA & EXAMPLES:
+- Include {data_points} specific data points with sources
+- Use real company case studies with quantified outcomes
+- Prefer recent examples from 2024-2025
+- Include market context and competitive landscape when relevant
+
+STRUCTURE & FLOW:
+- Target {target_para_length} words per paragraph
+- Use proven transition patterns: {transitions}
+- Vary paragraph length: short (1-2 sentences) and medium (3-4 sentences)
+- Create logical progression: context → problem → analysis → solution
+
+VOICE AUTHENTICITY:
+- Channel Tom's analytical confidence and industry expertise
+- Write as an insider with access to non-public insights
+- Balance technological optimism with business pragmatism
+- Use specific, concrete language over abstract concepts
+- Include practical "what this means" implications
+
+QUALITY MARKERS:
+- Every paragraph serves a specific purpose in the argument
+- Insights feel novel and non-obvious to industry experts
+- Conclusion provides actionable next steps or predictions
+- Overall thesis is defensible and well-supported with evidence
+"""
+    
+    return "".join((base_prompt, comprehensive_additions))
 
 
 class PromptGenerator:
@@ -41,6 +209,7 @@ class PromptGenerator:
         
         # Load current base prompt from generate_blog_post.py
         self.base_prompt = self._load_current_prompt()
+        self._present_voice = set(_VOICE_KEYWORDS_RE.findall(self.base_prompt.lower()))
         self.prompt_variations: List[PromptVariation] = []
     
     def _load_current_prompt(self) -> str:
@@ -48,21 +217,15 @@ class PromptGenerator:
         
         try:
             generator_file = Path(__file__).parent / "generate_blog_post.py"
-            with open(generator_file, 'r') as f:
-                content = f.read()
-            
-            # Extract the style guide section
-            style_start = content.find('style_guide = """')
-            if style_start == -1:
-                raise ValueError("Style guide not found in generate_blog_post.py")
-            
-            style_start += len('style_guide = """')
-            style_end = content.find('"""', style_start)
-            
-            if style_end == -1:
-                raise ValueError("Style guide end not found")
-            
-            return content[style_start:style_end].strip()
+            with open(generator_file, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                match = _STYLE_RE.search(mm)
+                if match is None:
+                    raise ValueError("Style guide not found in generate_blog_post.py")
+                
+                # Normalize newlines as text mode would, so CRLF checkouts don't leak \r into prompts
+                prompt = match.group(1).replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+                return prompt.decode('utf-8').strip()
             
         except Exception as e:
             print(f"Warning: Could not load current prompt: {e}")
@@ -103,27 +266,18 @@ STYLE CHARACTERISTICS:
                            performance_feedback: Optional[Dict] = None) -> List[str]:
         """Identify gaps between current prompt and published post patterns"""
         
-        gaps = []
-        
         # Analyze style patterns vs current prompt
-        if style_analysis.avg_paragraph_length < 30:
-            gaps.append("paragraphs_too_short")
-        elif style_analysis.avg_paragraph_length > 60:
-            gaps.append("paragraphs_too_long")
-        
-        if style_analysis.data_points_per_post < 2:
-            gaps.append("insufficient_data_points")
+        gaps = list(_numeric_gaps(style_analysis.avg_paragraph_length,
+                                  style_analysis.data_points_per_post))
         
         # Check for specific voice characteristics
-        voice_keywords = ["analytical", "data-driven", "practical", "forward-looking"]
-        for keyword in voice_keywords:
-            if keyword not in self.base_prompt.lower():
-                gaps.append(f"missing_voice_{keyword}")
+        gaps.extend(f"missing_voice_{keyword}" for keyword in VOICE_KEYWORDS
+                    if keyword not in self._present_voice)
         
         # Add performance-based gaps
         if performance_feedback:
-            low_scores = [k for k, v in performance_feedback.items() if v < 0.7]
-            gaps.extend([f"low_{score}" for score in low_scores])
+            gaps.extend(f"low_{score}" for score, value in performance_feedback.items()
+                        if value < LOW_SCORE_THRESHOLD)
         
         return gaps
     
@@ -171,7 +325,7 @@ STYLE CHARACTERISTICS:
             ))
         
         # Variation 4: Topic-Specific Optimization
-        top_topics = list(style_analysis.topic_distribution.keys())[:2]
+        top_topics = [topic for topic, _ in style_analysis.topic_distribution[:2]]
         if top_topics:
             topic_optimized_prompt = self._create_topic_optimized_prompt(style_analysis, top_topics)
             variations.append(PromptVariation(
@@ -194,149 +348,64 @@ STYLE CHARACTERISTICS:
             version=f"{version_prefix}.5"
         ))
         
+        # Count words once here rather than on every log call
+        for variation in variations:
+            variation.token_count = len(variation.prompt_text.split())
+        
         self.prompt_variations = variations
         return variations
     
     def _create_enhanced_data_prompt(self, style_analysis: StyleAnalysis) -> str:
         """Create prompt with enhanced data integration"""
-        
-        data_emphasis = f"""
-CRITICAL DATA REQUIREMENTS:
-- MUST include exactly {int(style_analysis.data_points_per_post)} specific data points or statistics
-- Use real company examples with specific metrics (revenue, growth rates, user counts)
-- Include percentages, dollar amounts, or quantified comparisons
-- Examples: "Klarna reduced costs by 66%", "ARR grew from $10M to $50M", "conversion rates improved 3x"
-- If you don't know exact figures, use [NEEDS DATA: description] placeholders
-- Prefer recent data from 2024-2025 when possible
-"""
-        
-        return self.base_prompt + data_emphasis
+        return _build_enhanced_data_prompt(self.base_prompt, style_analysis)
     
     def _create_structured_flow_prompt(self, style_analysis: StyleAnalysis) -> str:
         """Create prompt with improved structure and flow"""
-        
-        target_para_length = int(style_analysis.avg_paragraph_length)
-        
-        structure_emphasis = f"""
-ENHANCED STRUCTURE REQUIREMENTS:
-- Target paragraph length: {target_para_length} words per paragraph
-- Use these specific transition patterns: {', '.join(style_analysis.common_transitions[:3])}
-- First paragraph: Bold declarative statement (1 sentence, under 10 words)
-- Second paragraph: Thought-provoking question or contrarian observation
-- Body paragraphs: Mix of 2-sentence and 3-sentence paragraphs for rhythm
-- Each paragraph must flow logically to the next with clear connective tissue
-- Conclusion: Forward-looking statement that reinforces the main insight
-"""
-        
-        return self.base_prompt + structure_emphasis
+        return _build_structured_flow_prompt(self.base_prompt, style_analysis)
     
     def _create_voice_enhanced_prompt(self, style_analysis: StyleAnalysis) -> str:
         """Create prompt with enhanced Tom Tunguz voice"""
-        
-        voice_emphasis = f"""
-TOM TUNGUZ VOICE AMPLIFICATION:
-- Channel these specific characteristics: {', '.join(style_analysis.voice_characteristics)}
-- Write with analytical confidence - state insights as facts, not opinions
-- Use present tense for trends: "Companies are discovering..." not "Companies will discover..."
-- Include practical implications: "This means..." or "The result is..."
-- Avoid hedge words: "perhaps", "maybe", "could be"
-- Write as an industry insider with deep expertise
-- Balance optimism about technology with practical business realities
-- Reference specific companies and real examples, not hypothetical scenarios
-"""
-        
-        return self.base_prompt + voice_emphasis
+        return _build_voice_enhanced_prompt(self.base_prompt, style_analysis)
     
     def _create_topic_optimized_prompt(self, style_analysis: StyleAnalysis, topics: List[str]) -> str:
         """Create prompt optimized for specific topics"""
-        
-        topic_guidance = {}
-        
-        if "SaaS" in topics:
-            topic_guidance["SaaS"] = "Focus on metrics like ARR, churn, LTV/CAC, expansion revenue. Reference successful SaaS companies and their growth strategies."
-        
-        if "AI" in topics:
-            topic_guidance["AI"] = "Emphasize practical business applications, not theoretical capabilities. Include real implementation examples and measurable business impact."
-        
-        if "data" in topics:
-            topic_guidance["data"] = "Focus on actionable insights and business outcomes. Avoid technical jargon in favor of business impact and ROI."
-        
-        topic_emphasis = f"""
-TOPIC-SPECIFIC GUIDANCE:
-{chr(10).join([f"- {topic}: {guidance}" for topic, guidance in topic_guidance.items()])}
-
-INDUSTRY CONTEXT:
-- Assume audience of founders, VCs, and business leaders
-- Focus on practical applications and business impact
-- Include relevant market sizing and trend data when available
-"""
-        
-        return self.base_prompt + topic_emphasis
+        return _build_topic_optimized_prompt(self.base_prompt, style_analysis, tuple(topics))
     
     def _create_comprehensive_prompt(self, style_analysis: StyleAnalysis, gaps: List[str]) -> str:
         """Create comprehensive prompt addressing all gaps"""
-        
-        # Combine all enhancements
-        comprehensive_additions = f"""
-COMPREHENSIVE OPTIMIZATION (Version C):
-
-DATA & EXAMPLES:
-- Include {int(style_analysis.data_points_per_post)} specific data points with sources
-- Use real company case studies with quantified outcomes
-- Prefer recent examples from 2024-2025
-- Include market context and competitive landscape when relevant
-
-STRUCTURE & FLOW:
-- Target {int(style_analysis.avg_paragraph_length)} words per paragraph
-- Use proven transition patterns: {', '.join(style_analysis.common_transitions[:2])}
-- Vary paragraph length: short (1-2 sentences) and medium (3-4 sentences)
-- Create logical progression: context → problem → analysis → solution
-
-VOICE AUTHENTICITY:
-- Channel Tom's analytical confidence and industry expertise
-- Write as an insider with access to non-public insights
-- Balance technological optimism with business pragmatism
-- Use specific, concrete language over abstract concepts
-- Include practical "what this means" implications
-
-QUALITY MARKERS:
-- Every paragraph serves a specific purpose in the argument
-- Insights feel novel and non-obvious to industry experts
-- Conclusion provides actionable next steps or predictions
-- Overall thesis is defensible and well-supported with evidence
-"""
-        
-        return self.base_prompt + comprehensive_additions
+        return _build_comprehensive_prompt(self.base_prompt, style_analysis)
     
-    def save_variations(self, iteration: int) -> Path:
-        """Save prompt variations to file"""
+    def save_variations(self, iteration: int, run_timestamp: Optional[str] = None) -> Path:
+        """Save prompt variations to file (run_timestamp shares one prefix across a run)"""
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = run_timestamp or time.strftime("%Y%m%d_%H%M%S")
         variations_file = self.output_dir / f"prompt_variations_iter{iteration:02d}_{timestamp}.json"
         
-        variations_data = {
+        header = {
             "iteration": iteration,
             "timestamp": timestamp,
-            "base_prompt": self.base_prompt,
-            "variations": [
-                {
-                    "name": v.name,
-                    "description": v.description,
-                    "prompt_text": v.prompt_text,
-                    "target_improvements": v.target_improvements,
-                    "expected_score_improvement": v.expected_score_improvement,
-                    "version": v.version
-                }
-                for v in self.prompt_variations
-            ]
+            "base_prompt": self.base_prompt
         }
         
-        with open(variations_file, 'w') as f:
-            json.dump(variations_data, f, indent=2)
+        # Stream one variation at a time instead of building the whole document
+        with open(variations_file, 'wb') as f:
+            f.write(b"{\n")
+            for key, value in header.items():
+                f.write(b'  "%s": %s,\n' % (key.encode(), orjson.dumps(value)))
+            f.write(b'  "variations": [')
+            for i, variation_dict in enumerate(self._iter_variation_dicts()):
+                f.write(b",\n    " if i else b"\n    ")
+                f.write(orjson.dumps(variation_dict))
+            f.write(b"\n  ]\n}\n")
         
         print(f"💾 Prompt variations saved to: {variations_file}")
         return variations_file
     
+    def _iter_variation_dicts(self):
+        """Yield serializable dicts for the current prompt variations"""
+        for variation in self.prompt_variations:
+            yield asdict(variation)
+    
     def get_best_variation_for_testing(self) -> PromptVariation:
         """Get the variation with highest expected improvement for testing"""
         
@@ -347,7 +416,8 @@ QUALITY MARKERS:
     
     def generate_iterative_improvements(self, style_analysis: StyleAnalysis, 
                                       previous_results: Optional[Dict] = None,
-                                      iteration: int = 1) -> List[PromptVariation]:
+                                      iteration: int = 1,
+                                      run_timestamp: Optional[str] = None) -> List[PromptVariation]:
         """Main function to generate improved prompts"""
         
         print(f"🚀 Generating prompt improvements for iteration {iteration}...")
@@ -366,23 +436,29 @@ QUALITY MARKERS:
             print(f"      • {v.name}: targeting {'+'.join(v.target_improvements)} (+{v.expected_score_improvement:.1%})")
         
         # Save to file
-        self.save_variations(iteration)
+        self.save_variations(iteration, run_timestamp)
         
-        # Log to Braintrust
-        if self.braintrust_tracker:
-            for variation in variations:
-                self.braintrust_tracker.log_generation(
-                    model="prompt_generator",
-                    strategy=variation.name,
-                    cycle=iteration,
-                    prompt=f"Generate improved prompt: {variation.description}",
-                    output=variation.prompt_text,
-                    cost=0.0,
-                    tokens=len(variation.prompt_text.split()),
-                    latency=0.1
-                )
+        # Log to Braintrust (one request per variation, issued in parallel); log_generation
+        # is a no-op unless the tracker is enabled and has an experiment running
+        tracker = self.braintrust_tracker
+        if tracker and tracker.enabled and tracker.experiment and variations:
+            with ThreadPoolExecutor(max_workers=len(variations)) as executor:
+                list(executor.map(self._log_variation, variations, itertools.repeat(iteration)))
         
         return variations
+    
+    def _log_variation(self, variation: PromptVariation, iteration: int) -> None:
+        """Log a single prompt variation to Braintrust"""
+        self.braintrust_tracker.log_generation(
+            model="prompt_generator",
+            strategy=variation.name,
+            cycle=iteration,
+            prompt=f"Generate improved prompt: {variation.description}",
+            output=variation.prompt_text,
+            cost=0.0,
+            tokens=variation.token_count,
+            latency=0.1
+        )
 
 
 def main():
@@ -393,11 +469,11 @@ def main():
         avg_paragraph_length=45.0,
         avg_sentence_length=18.0,
         data_points_per_post=2.5,
-        common_transitions=["However", "More importantly", "The transformation"],
-        hook_patterns=["question_opening", "bold_statement"],
-        conclusion_patterns=["future_prediction", "competitive_advantage"],
-        voice_characteristics=["analytical", "data-driven", "practical"],
-        topic_distribution={"SaaS": 8, "AI": 6, "data": 4}
+        common_transitions=("However", "More importantly", "The transformation"),
+        hook_patterns=("question_opening", "bold_statement"),
+        conclusion_patterns=("future_prediction", "competitive_advantage"),
+        voice_characteristics=("analytical", "data-driven", "practical"),
+        topic_distribution=(("SaaS", 8), ("AI", 6), ("data", 4))
     )
     
     tracker = BraintrustTracker("prompt-generation-test")
@@ -4,18 +4,82 @@ SCQA Planning Module
 Uses Claude Opus 4 to structure blog topics into SCQA framework before generation
 """
 
-import json
+import copy
+import re
 import sys
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
+
+import orjson
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 from models import ClaudeClient
 
+# Outermost {...} span in a model response
+_JSON_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+# Placeholder phrases that indicate a generic (fallback-quality) answer
+_GENERIC_TERMS = ("emerging challenges", "current state", "analysis and insights")
+_GENERIC_TERMS_RE = re.compile("|".join(re.escape(term) for term in _GENERIC_TERMS))
+
+# Default template if the templates file doesn't exist
+_DEFAULT_TEMPLATES = {
+    "situation": {
+        "description": "Current stable state/context",
+        "prompts": ["What is the current status quo?", "What stable situation exists?"]
+    },
+    "complication": {
+        "description": "The disruption/problem/change", 
+        "prompts": ["What is changing?", "What problem has emerged?"]
+    },
+    "question": {
+        "description": "The key question this creates",
+        "prompts": ["What question does this raise?", "What needs to be answered?"]
+    },
+    "answer": {
+        "description": "The insight/solution/response",
+        "prompts": ["What evidence-based answer do we have?", "What should be done?"]
+    }
+}
+
+# SCQAStructure fields read from a model response, with defaults for missing keys
+_SCQA_FIELD_DEFAULTS = {
+    "situation": "",
+    "complication": "",
+    "question": "",
+    "answer": "",
+    "confidence_score": 75,
+    "narrative_flow": "Standard SCQA progression"
+}
+
+# Fallback SCQA components when Claude is unavailable
+_FALLBACK_TEMPLATE = {
+    "situation": "Current state in the area of {topic}",
+    "complication": "Emerging challenges or changes related to {topic}",
+    "question": "What does this mean for the future of {topic}?",
+    "answer": "Analysis and insights about {topic}"
+}
 
-@dataclass
+
+@lru_cache(maxsize=1)
+def _load_scqa_templates(path: str) -> Dict:
+    """Load SCQA templates once per path (callers copy before handing them out)"""
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+        return orjson.loads(data)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Warning: Could not load SCQA templates: {e}")
+    
+    return _DEFAULT_TEMPLATES
+
+
+@dataclass(slots=True)
 class SCQAStructure:
     """Represents the SCQA structure for a blog post"""
     situation: str          # Current stable state/context
@@ -29,6 +93,42 @@ class SCQAStructure:
 class SCQAPlanner:
     """Plans blog post structure using SCQA framework with Claude Opus 4"""
     
+    # Filled with str.format_map; literal JSON braces are doubled
+    _ANALYSIS_TEMPLATE = """You are an expert content strategist helping structure a blog post using the SCQA framework (Situation, Complication, Question, Answer).
+
+TOPIC: {topic}
+{title_line}
+
+Your task is to analyze this topic and create a clear SCQA structure that will guide blog post generation.
+
+SCQA FRAMEWORK:
+- SITUATION: The current stable state, status quo, or established context
+- COMPLICATION: The disruption, problem, change, or tension that has emerged
+- QUESTION: The key question or challenge this creates (often implicit)
+- ANSWER: The insight, solution, or response based on evidence and analysis
+
+REQUIREMENTS:
+1. Each component should be 1-3 sentences
+2. Ensure logical flow: Situation → Complication → Question → Answer
+3. Make the Question compelling and specific
+4. Base the Answer on evidence, data, or logical reasoning
+5. Focus on practical insights for startup founders and VCs
+6. Avoid generic business clichés
+
+RESPONSE FORMAT:
+Please respond with EXACTLY this JSON structure:
+
+{{
+  "situation": "Current stable context or status quo...",
+  "complication": "The disruption or problem that has emerged...", 
+  "question": "The key question this creates...",
+  "answer": "The evidence-based insight or solution...",
+  "confidence_score": 85,
+  "narrative_flow": "Brief description of how this flows logically"
+}}
+
+Analyze the topic and provide the SCQA structure:"""
+    
     def __init__(self, claude_client: ClaudeClient = None):
         """Initialize the SCQA planner"""
         self.claude_client = claude_client
@@ -37,32 +137,8 @@ class SCQAPlanner:
     
     def _load_templates(self) -> Dict:
         """Load SCQA templates from config"""
-        try:
-            if self.template_path.exists():
-                with open(self.template_path, 'r') as f:
-                    return json.load(f)
-        except Exception as e:
-            print(f"Warning: Could not load SCQA templates: {e}")
-        
-        # Default template if file doesn't exist
-        return {
-            "situation": {
-                "description": "Current stable state/context",
-                "prompts": ["What is the current status quo?", "What stable situation exists?"]
-            },
-            "complication": {
-                "description": "The disruption/problem/change", 
-                "prompts": ["What is changing?", "What problem has emerged?"]
-            },
-            "question": {
-                "description": "The key question this creates",
-                "prompts": ["What question does this raise?", "What needs to be answered?"]
-            },
-            "answer": {
-                "description": "The insight/solution/response",
-                "prompts": ["What evidence-based answer do we have?", "What should be done?"]
-            }
-        }
+        # The parsed file is cached and shared, so each planner gets its own copy
+        return copy.deepcopy(_load_scqa_templates(str(self.template_path)))
     
     def plan_structure(self, topic: str, title: str = "") -> SCQAStructure:
         """
@@ -107,62 +183,25 @@ class SCQAPlanner:
     def _build_analysis_prompt(self, topic: str, title: str) -> str:
         """Build the prompt for SCQA analysis"""
         
-        return f"""You are an expert content strategist helping structure a blog post using the SCQA framework (Situation, Complication, Question, Answer).
-
-TOPIC: {topic}
-{f"TITLE: {title}" if title else ""}
-
-Your task is to analyze this topic and create a clear SCQA structure that will guide blog post generation.
-
-SCQA FRAMEWORK:
-- SITUATION: The current stable state, status quo, or established context
-- COMPLICATION: The disruption, problem, change, or tension that has emerged
-- QUESTION: The key question or challenge this creates (often implicit)
-- ANSWER: The insight, solution, or response based on evidence and analysis
-
-REQUIREMENTS:
-1. Each component should be 1-3 sentences
-2. Ensure logical flow: Situation → Complication → Question → Answer
-3. Make the Question compelling and specific
-4. Base the Answer on evidence, data, or logical reasoning
-5. Focus on practical insights for startup founders and VCs
-6. Avoid generic business clichés
-
-RESPONSE FORMAT:
-Please respond with EXACTLY this JSON structure:
-
-{{
-  "situation": "Current stable context or status quo...",
-  "complication": "The disruption or problem that has emerged...", 
-  "question": "The key question this creates...",
-  "answer": "The evidence-based insight or solution...",
-  "confidence_score": 85,
-  "narrative_flow": "Brief description of how this flows logically"
-}}
-
-Analyze the topic and provide the SCQA structure:"""
+        title_line = f"TITLE: {title}" if title else ""
+        return self._ANALYSIS_TEMPLATE.format_map({"topic": topic, "title_line": title_line})
     
     def _parse_scqa_response(self, response: str, topic: str) -> SCQAStructure:
         """Parse Claude's response into SCQAStructure"""
         try:
             # Extract JSON from response
-            json_start = response.find('{')
-            json_end = response.rfind('}') + 1
-            
-            if json_start == -1 or json_end == 0:
+            match = _JSON_RE.search(response)
+            if match is None:
                 raise ValueError("No JSON found in response")
             
-            json_str = response[json_start:json_end]
-            data = json.loads(json_str)
+            json_str = match.group(0)
+            data = orjson.loads(json_str)
             
-            return SCQAStructure(
-                situation=data.get('situation', ''),
-                complication=data.get('complication', ''),
-                question=data.get('question', ''),
-                answer=data.get('answer', ''),
-                confidence_score=data.get('confidence_score', 75),
-                narrative_flow=data.get('narrative_flow', 'Standard SCQA progression')
-            )
+            if not isinstance(data, dict):
+                raise ValueError("SCQA response is not a JSON object")
+            
+            return SCQAStructure(**{field: data.get(field, default)
+                                    for field, default in _SCQA_FIELD_DEFAULTS.items()})
             
         except Exception as e:
             print(f"Failed to parse SCQA response: {e}")
@@ -171,10 +210,7 @@ Analyze the topic and provide the SCQA structure:"""
     def _create_fallback_structure(self, topic: str, title: str) -> SCQAStructure:
         """Create a basic SCQA structure when Claude is unavailable"""
         return SCQAStructure(
-            situation=f"Current state in the area of {topic}",
-            complication=f"Emerging challenges or changes related to {topic}",
-            question=f"What does this mean for the future of {topic}?",
-            answer=f"Analysis and insights about {topic}",
+            **{field: text.format(topic=topic) for field, text in _FALLBACK_TEMPLATE.items()},
             confidence_score=50,
             narrative_flow="Basic fallback structure"
         )
@@ -242,9 +278,9 @@ Original topic for reference: {original_topic}"""
             issues.append(f"Low confidence score: {scqa_structure.confidence_score}")
         
         # Check for generic content
-        generic_terms = ["emerging challenges", "current state", "analysis and insights"]
-        for term in generic_terms:
-            if term.lower() in scqa_structure.answer.lower():
+        found_terms = set(_GENERIC_TERMS_RE.findall(scqa_structure.answer.lower()))
+        for term in _GENERIC_TERMS:
+            if term in found_terms:
                 issues.append(f"Generic content detected: '{term}'")
         
         return len(issues) == 0, issues
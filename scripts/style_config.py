@@ -4,10 +4,85 @@ Style Configuration Loader
 Loads writing style preferences from configuration files
 """
 
+import functools
 import json
 import os
 from pathlib import Path
-from typing import Dict, List, Any
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Sequence
+
+import orjson
+
+
+# Candidate locations for the writing style config, in priority order
+_CANDIDATE_CONFIG_PATHS = (
+    "config/writing_style.json",
+    "../config/writing_style.json",
+    str(Path(__file__).resolve().parent.parent / "config" / "writing_style.json")
+)
+
+# Resolved once at import; falls back to the first candidate if none exist
+_DEFAULT_STYLE_CONFIG_PATH = next(
+    (path for path in _CANDIDATE_CONFIG_PATHS if os.path.exists(path)),
+    _CANDIDATE_CONFIG_PATHS[0]
+)
+
+# Fallback ranges for the writing_style settings
+_DEFAULT_TARGET_WORD_COUNT = (500, 750)
+_DEFAULT_SENTENCES_PER_PARAGRAPH = (2, 4)
+_DEFAULT_DATA_POINTS_PER_POST = (2, 4)
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# Used when the config file is missing or invalid; shared, so frozen all the way down
+_DEFAULT_CONFIG = _freeze({
+    "author": {
+        "name": "Professional Writer",
+        "description": "Generic professional writing style"
+    },
+    "blog_info": {
+        "url": "https://yourblog.com"
+    },
+    "voice_characteristics": (
+        "Data-driven analysis",
+        "Clear, direct communication", 
+        "Business insights focus",
+        "Practical actionable advice",
+        "Industry expertise"
+    ),
+    "writing_style": {
+        "tone": "professional",
+        "target_word_count": _DEFAULT_TARGET_WORD_COUNT,
+        "sentences_per_paragraph": _DEFAULT_SENTENCES_PER_PARAGRAPH,
+        "prefer_short_paragraphs": True,
+        "data_points_per_post": _DEFAULT_DATA_POINTS_PER_POST,
+        "opening_hook_required": True,
+        "conclusion_style": "forward-looking"
+    }
+})
+
+# Fallback when a loaded config omits voice_characteristics
+_DEFAULT_VOICE_CHARACTERISTICS = (
+    "Data-driven analysis",
+    "Clear, direct communication"
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_style_json(abs_path: str) -> Mapping[str, Any]:
+    """Parse a style config file once per absolute path (frozen, since the result is shared)"""
+    with open(abs_path, 'rb') as f:
+        data = f.read()
+    return _freeze(orjson.loads(data))
+
 
 class StyleConfig:
     """Manages writing style configuration"""
@@ -21,28 +96,17 @@ class StyleConfig:
         """
         self.config_path = config_path or self._find_config_file()
         self.config = self._load_config()
+        self._voice_block = "\n".join("- " + char for char in self.voice_characteristics)
+        self._prompt_vars = self._build_system_prompt_variables()
     
     def _find_config_file(self) -> str:
         """Find the writing style configuration file"""
-        # Try different locations
-        possible_paths = [
-            "config/writing_style.json",
-            "../config/writing_style.json",
-            os.path.join(Path(__file__).parent.parent, "config", "writing_style.json")
-        ]
-        
-        for path in possible_paths:
-            if os.path.exists(path):
-                return path
-        
-        # Default fallback
-        return "config/writing_style.json"
+        return _DEFAULT_STYLE_CONFIG_PATH
     
-    def _load_config(self) -> Dict[str, Any]:
+    def _load_config(self) -> Mapping[str, Any]:
         """Load configuration from file"""
         try:
-            with open(self.config_path, 'r') as f:
-                return json.load(f)
+            return _load_style_json(os.path.abspath(self.config_path))
         except FileNotFoundError:
             print(f"⚠️  Configuration file not found: {self.config_path}")
             return self._get_default_config()
@@ -50,83 +114,60 @@ class StyleConfig:
             print(f"⚠️  Invalid JSON in config file: {e}")
             return self._get_default_config()
     
-    def _get_default_config(self) -> Dict[str, Any]:
+    def _get_default_config(self) -> Mapping[str, Any]:
         """Return default configuration"""
-        return {
-            "author": {
-                "name": "Professional Writer",
-                "description": "Generic professional writing style"
-            },
-            "blog_info": {
-                "url": "https://yourblog.com"
-            },
-            "voice_characteristics": [
-                "Data-driven analysis",
-                "Clear, direct communication", 
-                "Business insights focus",
-                "Practical actionable advice",
-                "Industry expertise"
-            ],
-            "writing_style": {
-                "tone": "professional",
-                "target_word_count": [500, 750],
-                "sentences_per_paragraph": [2, 4],
-                "prefer_short_paragraphs": True,
-                "data_points_per_post": [2, 4],
-                "opening_hook_required": True,
-                "conclusion_style": "forward-looking"
-            }
-        }
+        return _DEFAULT_CONFIG
     
-    @property
+    @functools.cached_property
     def author_name(self) -> str:
         """Get author name"""
         return self.config.get("author", {}).get("name", "Professional Writer")
     
-    @property
+    @functools.cached_property
     def blog_url(self) -> str:
         """Get blog URL"""
         return self.config.get("blog_info", {}).get("url", "https://yourblog.com")
     
-    @property
-    def voice_characteristics(self) -> List[str]:
+    @functools.cached_property
+    def voice_characteristics(self) -> Sequence[str]:
         """Get voice characteristics"""
-        return self.config.get("voice_characteristics", [
-            "Data-driven analysis",
-            "Clear, direct communication"
-        ])
+        return self.config.get("voice_characteristics", _DEFAULT_VOICE_CHARACTERISTICS)
     
-    @property
-    def target_word_count(self) -> List[int]:
+    @functools.cached_property
+    def target_word_count(self) -> Sequence[int]:
         """Get target word count range"""
-        return self.config.get("writing_style", {}).get("target_word_count", [500, 750])
+        return self.config.get("writing_style", {}).get("target_word_count", _DEFAULT_TARGET_WORD_COUNT)
     
-    @property
-    def sentences_per_paragraph(self) -> List[int]:
+    @functools.cached_property
+    def sentences_per_paragraph(self) -> Sequence[int]:
         """Get sentences per paragraph range"""
-        return self.config.get("writing_style", {}).get("sentences_per_paragraph", [2, 4])
+        return self.config.get("writing_style", {}).get("sentences_per_paragraph", _DEFAULT_SENTENCES_PER_PARAGRAPH)
     
-    @property
-    def data_points_per_post(self) -> List[int]:
+    @functools.cached_property
+    def data_points_per_post(self) -> Sequence[int]:
         """Get data points per post range"""
-        return self.config.get("writing_style", {}).get("data_points_per_post", [2, 4])
+        return self.config.get("writing_style", {}).get("data_points_per_post", _DEFAULT_DATA_POINTS_PER_POST)
     
-    @property
+    @functools.cached_property
     def writing_tone(self) -> str:
         """Get writing tone"""
         return self.config.get("writing_style", {}).get("tone", "professional")
     
-    @property
+    @functools.cached_property
     def conclusion_style(self) -> str:
         """Get conclusion style"""
         return self.config.get("writing_style", {}).get("conclusion_style", "forward-looking")
     
     def format_voice_characteristics(self) -> str:
         """Format voice characteristics for prompts"""
-        return "\n".join([f"- {char}" for char in self.voice_characteristics])
+        return self._voice_block
+    
+    def get_system_prompt_variables(self) -> Mapping[str, str]:
+        """Get variables for system prompt formatting (read-only view)"""
+        return MappingProxyType(self._prompt_vars)
     
-    def get_system_prompt_variables(self) -> Dict[str, str]:
-        """Get variables for system prompt formatting"""
+    def _build_system_prompt_variables(self) -> Dict[str, str]:
+        """Resolve prompt variables once; the config does not change after load"""
         return {
             "author_name": self.author_name,
             "blog_url": self.blog_url,
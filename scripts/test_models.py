@@ -4,24 +4,44 @@ Test script for model integrations
 Verifies that all model clients work correctly
 """
 
+import functools
 import os
 import sys
-import json
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+import orjson
+
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from models import ClaudeClient, OpenAIClient, GeminiClient, LocalClient
+from buffered_output import run_buffered, thread_buffered_stdout
+
+# Resolved once at import; CONFIG_DIR is read from the environment at startup
+_API_KEYS_PATH = Path(os.getenv("CONFIG_DIR", "./config")) / "config" / "model_configs.json"
+
+# Ollama's model listing endpoint doubles as a cheap daemon health check
+OLLAMA_TAGS_URL = "http://localhost:11434/api/tags"
 
 
+@functools.lru_cache(maxsize=1)
 def load_api_keys():
-    """Load API keys from config file or environment"""
-    config_path = Path(os.getenv("CONFIG_DIR", "./config")) / "config" / "model_configs.json"
+    """Load API keys from config file or environment (read once per process)"""
+    # Skip the config file entirely when every key is set in the environment (e.g. CI)
+    env_keys = {
+        "anthropic_api_key": os.getenv("ANTHROPIC_API_KEY"),
+        "openai_api_key": os.getenv("OPENAI_API_KEY"),
+        "google_api_key": os.getenv("GOOGLE_API_KEY")
+    }
+    if all(env_keys.values()):
+        return env_keys
+    
+    config_path = _API_KEYS_PATH
     
     if config_path.exists():
-        with open(config_path, 'r') as f:
-            return json.load(f)
+        return orjson.loads(config_path.read_bytes())
     else:
         # Create template config file
         template = {
@@ -31,14 +51,25 @@ def load_api_keys():
             "note": "Replace with your actual API keys or set as environment variables"
         }
         
-        with open(config_path, 'w') as f:
-            json.dump(template, f, indent=2)
+        config_path.write_bytes(orjson.dumps(template, option=orjson.OPT_INDENT_2))
         
         print(f"Created template config at: {config_path}")
         print("Please add your API keys to the config file or set them as environment variables")
         return template
 
 
+def _list_ollama_models():
+    """Return installed Ollama model names, or None if the daemon is unreachable"""
+    try:
+        with urllib.request.urlopen(OLLAMA_TAGS_URL, timeout=0.5) as response:
+            data = response.read()
+    except (urllib.error.URLError, OSError):
+        return None
+    
+    tags = orjson.loads(data)
+    return [model.get('name') for model in tags.get('models', [])]
+
+
 def test_claude():
     """Test Claude client"""
     print("\n" + "="*50)
@@ -46,6 +77,8 @@ def test_claude():
     print("="*50)
     
     try:
+        from models import ClaudeClient
+        
         config = load_api_keys()
         client = ClaudeClient(
             api_key=config.get('anthropic_api_key'),
@@ -61,12 +94,14 @@ def test_claude():
             print(f"❌ Error: {response.error}")
             return False
         
-        print(f"✅ Success!")
-        print(f"Model: {response.model}")
-        print(f"Tokens: {response.tokens_used}")
-        print(f"Cost: ${response.cost:.4f}")
-        print(f"Latency: {response.latency_seconds:.2f}s")
-        print(f"\nContent preview: {response.content[:200]}...")
+        sys.stdout.write("\n".join([
+            "✅ Success!",
+            f"Model: {response.model}",
+            f"Tokens: {response.tokens_used}",
+            f"Cost: ${response.cost:.4f}",
+            f"Latency: {response.latency_seconds:.2f}s",
+            f"\nContent preview: {response.content[:200]}..."
+        ]) + "\n")
         
         return True
         
@@ -82,6 +117,8 @@ def test_openai():
     print("="*50)
     
     try:
+        from models import OpenAIClient
+        
         config = load_api_keys()
         client = OpenAIClient(
             api_key=config.get('openai_api_key'),
@@ -97,12 +134,14 @@ def test_openai():
             print(f"❌ Error: {response.error}")
             return False
         
-        print(f"✅ Success!")
-        print(f"Model: {response.model}")
-        print(f"Tokens: {response.tokens_used}")
-        print(f"Cost: ${response.cost:.4f}")
-        print(f"Latency: {response.latency_seconds:.2f}s")
-        print(f"\nContent preview: {response.content[:200]}...")
+        sys.stdout.write("\n".join([
+            "✅ Success!",
+            f"Model: {response.model}",
+            f"Tokens: {response.tokens_used}",
+            f"Cost: ${response.cost:.4f}",
+            f"Latency: {response.latency_seconds:.2f}s",
+            f"\nContent preview: {response.content[:200]}..."
+        ]) + "\n")
         
         return True
         
@@ -118,6 +157,8 @@ def test_gemini():
     print("="*50)
     
     try:
+        from models import GeminiClient
+        
         config = load_api_keys()
         client = GeminiClient(
             api_key=config.get('google_api_key'),
@@ -133,12 +174,14 @@ def test_gemini():
             print(f"❌ Error: {response.error}")
             return False
         
-        print(f"✅ Success!")
-        print(f"Model: {response.model}")
-        print(f"Tokens: {response.tokens_used}")
-        print(f"Cost: ${response.cost:.4f}")
-        print(f"Latency: {response.latency_seconds:.2f}s")
-        print(f"\nContent preview: {response.content[:200]}...")
+        sys.stdout.write("\n".join([
+            "✅ Success!",
+            f"Model: {response.model}",
+            f"Tokens: {response.tokens_used}",
+            f"Cost: ${response.cost:.4f}",
+            f"Latency: {response.latency_seconds:.2f}s",
+            f"\nContent preview: {response.content[:200]}..."
+        ]) + "\n")
         
         return True
         
@@ -154,24 +197,20 @@ def test_local():
     print("="*50)
     
     try:
-        # First check if Ollama is available
-        import subprocess
-        try:
-            result = subprocess.run(['ollama', 'list'], capture_output=True, timeout=2)
-            if result.returncode != 0:
-                print("⚠️  Ollama not running. Start with 'ollama serve'")
-                return False
-        except:
-            print("⚠️  Ollama not installed. Install from https://ollama.ai")
+        # First check if Ollama is available (the listing is reused below)
+        models = _list_ollama_models()
+        if models is None:
+            print("⚠️  Ollama not running. Start with 'ollama serve' (install from https://ollama.ai)")
             return False
         
+        from models import LocalClient
+        
         client = LocalClient(config={
             'backend': 'ollama',
             'model': 'llama3.2:3b'  # Small model for testing
         })
         
         # Check if model exists
-        models = client.list_models()
         print(f"Available models: {models}")
         
         if 'llama3.2:3b' not in str(models):
@@ -189,12 +228,14 @@ def test_local():
             print(f"❌ Error: {response.error}")
             return False
         
-        print(f"✅ Success!")
-        print(f"Model: {response.model}")
-        print(f"Tokens: {response.tokens_used}")
-        print(f"Cost: ${response.cost:.4f} (free - local)")
-        print(f"Latency: {response.latency_seconds:.2f}s")
-        print(f"\nContent preview: {response.content[:200]}...")
+        sys.stdout.write("\n".join([
+            "✅ Success!",
+            f"Model: {response.model}",
+            f"Tokens: {response.tokens_used}",
+            f"Cost: ${response.cost:.4f} (free - local)",
+            f"Latency: {response.latency_seconds:.2f}s",
+            f"\nContent preview: {response.content[:200]}..."
+        ]) + "\n")
         
         return True
         
@@ -208,18 +249,24 @@ def test_all():
     print("\n🚀 Testing All Model Integrations")
     print("="*60)
     
-    results = {
-        'Claude': False,
-        'OpenAI': False,
-        'Gemini': False,
-        'Local': False
+    tests = {
+        'Claude': test_claude,
+        'OpenAI': test_openai,
+        'Gemini': test_gemini,
+        'Local': test_local
     }
+    results = {name: False for name in tests}
+    
+    # Load the keys once up front: lru_cache doesn't serialize concurrent first calls,
+    # so workers racing on a cold cache would each read (or create) the config file
+    load_api_keys()
     
-    # Test each client
-    results['Claude'] = test_claude()
-    results['OpenAI'] = test_openai()
-    results['Gemini'] = test_gemini()
-    results['Local'] = test_local()
+    # Test each client concurrently; each test's output is printed as a block when it finishes
+    with thread_buffered_stdout(), ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        future_to_name = {executor.submit(run_buffered, func): name for name, func in tests.items()}
+        for future in as_completed(future_to_name):
+            results[future_to_name[future]], output = future.result()
+            print(output, end='')
     
     # Summary
     print("\n" + "="*60)
@@ -250,15 +297,19 @@ def quick_test(model_name: str):
     prompt = "Write one sentence about artificial intelligence."
     
     if model_name.lower() == 'claude':
+        from models import ClaudeClient
         config = load_api_keys()
         client = ClaudeClient(api_key=config.get('anthropic_api_key'))
     elif model_name.lower() == 'openai' or model_name.lower() == 'gpt':
+        from models import OpenAIClient
         config = load_api_keys()
         client = OpenAIClient(api_key=config.get('openai_api_key'))
     elif model_name.lower() == 'gemini':
+        from models import GeminiClient
         config = load_api_keys()
         client = GeminiClient(api_key=config.get('google_api_key'))
     elif model_name.lower() == 'local':
+        from models import LocalClient
         client = LocalClient(config={'backend': 'ollama'})
     else:
         print(f"Unknown model: {model_name}")
@@ -10,31 +10,8 @@ import shutil
 from datetime import datetime
 from pathlib import Path
 
-def setup_directories():
-    """Create the complete directory structure"""
-    base_dir = Path(os.getenv("CONFIG_DIR", "./config"))
-    
-    # Main directories
-    directories = [
-        "config",
-        "config/style_reference",
-        "templates",
-        "generations",
-        "scripts",
-        "evaluation",
-        "utils"
-    ]
-    
-    for dir_path in directories:
-        full_path = base_dir / dir_path
-        full_path.mkdir(parents=True, exist_ok=True)
-        print(f"✓ Created: {full_path}")
-    
-    return base_dir
-
-def create_gitignore(base_dir):
-    """Create .gitignore file"""
-    gitignore_content = """# API Keys and Secrets
+# Static files written by setup, pre-encoded once at import
+GITIGNORE_CONTENT = """# API Keys and Secrets
 config/model_configs.json
 .env
 *.key
@@ -56,14 +33,8 @@ __pycache__/
 .idea/
 *.swp
 """
-    
-    gitignore_path = base_dir / ".gitignore"
-    gitignore_path.write_text(gitignore_content)
-    print(f"✓ Created .gitignore")
 
-def create_readme(base_dir):
-    """Create README with usage instructions"""
-    readme_content = """# Evolutionary Blog Post Generator
+README_CONTENT = """# Evolutionary Blog Post Generator
 
 ## Overview
 Advanced blog post generation system using multiple AI models with iterative refinement.
@@ -105,9 +76,77 @@ Edit `config/global_settings.json` to customize:
 - Model parameters
 - Evaluation weights
 """
+
+REQUIREMENTS_CONTENT = """# AI Model APIs
+anthropic>=0.18.0
+openai>=1.0.0
+google-generativeai>=0.3.0
+
+# Text Processing
+beautifulsoup4>=4.12.0
+markdown>=3.4.0
+textstat>=0.7.3
+nltk>=3.8.0
+
+# Analysis
+scikit-learn>=1.3.0
+numpy>=1.24.0
+pandas>=2.0.0
+
+# Utilities
+python-dotenv>=1.0.0
+rich>=13.0.0
+click>=8.1.0
+pyyaml>=6.0
+
+# Local Model Support
+ollama>=0.1.0
+"""
+
+_GITIGNORE_BYTES = GITIGNORE_CONTENT.encode("utf-8")
+_README_BYTES = README_CONTENT.encode("utf-8")
+_REQUIREMENTS_BYTES = REQUIREMENTS_CONTENT.encode("utf-8")
+
+def _leaf_directories(paths):
+    """Drop paths that are ancestors of another path; mkdir(parents=True) creates them"""
+    paths = set(paths)
+    ancestors = {parent for path in paths for parent in path.parents}
+    return sorted(paths - ancestors, key=lambda path: len(path.parts))
+
+def setup_directories():
+    """Create the complete directory structure"""
+    base_dir = Path(os.getenv("CONFIG_DIR", "./config"))
     
+    # Main directories
+    directories = [
+        "config",
+        "config/style_reference",
+        "templates",
+        "generations",
+        "scripts",
+        "evaluation",
+        "utils"
+    ]
+    
+    full_paths = [base_dir / dir_path for dir_path in directories]
+    for leaf in _leaf_directories(full_paths):
+        leaf.mkdir(parents=True, exist_ok=True)
+    
+    for full_path in full_paths:
+        print(f"✓ Created: {full_path}")
+    
+    return base_dir
+
+def create_gitignore(base_dir):
+    """Create .gitignore file"""
+    gitignore_path = base_dir / ".gitignore"
+    gitignore_path.write_bytes(_GITIGNORE_BYTES)
+    print(f"✓ Created .gitignore")
+
+def create_readme(base_dir):
+    """Create README with usage instructions"""
     readme_path = base_dir / "README.md"
-    readme_path.write_text(readme_content)
+    readme_path.write_bytes(_README_BYTES)
     print(f"✓ Created README.md")
 
 def create_example_session(base_dir):
@@ -135,9 +174,8 @@ def create_example_session(base_dir):
         "final/alternatives"
     ]
     
-    for dir_name in session_dirs:
-        dir_path = example_session / dir_name
-        dir_path.mkdir(parents=True, exist_ok=True)
+    for leaf in _leaf_directories(example_session / dir_name for dir_name in session_dirs):
+        leaf.mkdir(parents=True, exist_ok=True)
     
     # Create example metadata
     metadata = {
@@ -188,14 +226,27 @@ rg "$1" --type json generations/*/metadata.json
 echo "Blog Generation Sessions"
 echo "========================"
 
-for session in generations/*/; do
-    if [ -f "$session/metadata.json" ]; then
-        echo ""
-        echo "📁 $(basename $session)"
-        # Use ripgrep to extract key fields
-        rg '"topic":|"created_at":|"final_selection":' "$session/metadata.json" | sed 's/^/  /'
-    fi
-done
+shopt -s nullglob
+metadata_files=(generations/*/metadata.json)
+[ ${#metadata_files[@]} -eq 0 ] && exit 0
+
+# Use a single ripgrep pass over every session's metadata, grouped by session.
+# awk reads the session list first so every session gets a header, even with no matching fields.
+rg --with-filename --no-heading '"topic":|"created_at":|"final_selection":' "${metadata_files[@]}" |
+    awk '
+        NR == FNR { files[++n] = $0; next }
+        {
+            file = $0; sub(/:.*/, "", file)
+            line = $0; sub(/^[^:]*:/, "", line)
+            lines[file] = lines[file] "  " line "\\n"
+        }
+        END {
+            for (i = 1; i <= n; i++) {
+                count = split(files[i], parts, "/")
+                printf "\\n📁 %s\\n%s", parts[count - 1], lines[files[i]]
+            }
+        }
+    ' <(printf '%s\\n' "${metadata_files[@]}") -
 """
     
     list_path = base_dir / "list_sessions.sh"
@@ -205,34 +256,8 @@ done
 
 def create_requirements(base_dir):
     """Create requirements.txt"""
-    requirements = """# AI Model APIs
-anthropic>=0.18.0
-openai>=1.0.0
-google-generativeai>=0.3.0
-
-# Text Processing
-beautifulsoup4>=4.12.0
-markdown>=3.4.0
-textstat>=0.7.3
-nltk>=3.8.0
-
-# Analysis
-scikit-learn>=1.3.0
-numpy>=1.24.0
-pandas>=2.0.0
-
-# Utilities
-python-dotenv>=1.0.0
-rich>=13.0.0
-click>=8.1.0
-pyyaml>=6.0
-
-# Local Model Support
-ollama>=0.1.0
-"""
-    
     req_path = base_dir / "requirements.txt"
-    req_path.write_text(requirements)
+    req_path.write_bytes(_REQUIREMENTS_BYTES)
     print(f"✓ Created requirements.txt")
 
 def main():
@@ -4,41 +4,59 @@ Test Braintrust Integration
 Verifies that Braintrust tracking works with the blog generator
 """
 
+import functools
+import json
 import os
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from unittest.mock import patch
 
 # Add scripts directory to path
-sys.path.insert(0, str(Path(__file__).parent / "scripts"))
+_SCRIPTS = os.path.join(os.path.dirname(__file__), "scripts")
+sys.path.insert(0, _SCRIPTS)
 
-from braintrust_integration import BraintrustTracker, setup_braintrust_for_blog_generator
+from buffered_output import run_buffered, thread_buffered_stdout
+
+def _run_test(test_func):
+    """Run one test function, reporting whether it passed"""
+    try:
+        test_func()
+        passed = True
+    except Exception as e:
+        print(f"❌ Test {test_func.__name__} failed: {e}")
+        passed = False
+    print()
+    return passed
+
+@functools.lru_cache(maxsize=1)
+def _load_global_settings(path="config/global_settings.json"):
+    """Read and parse the global settings file once"""
+    return json.loads(Path(path).read_text())
 
 def test_braintrust_setup():
     """Test basic Braintrust setup"""
     print("🧪 Testing Braintrust setup...")
+    from braintrust_integration import get_tracker
     
-    # Test without API key
-    original_key = os.getenv('BRAINTRUST_API_KEY')
-    if 'BRAINTRUST_API_KEY' in os.environ:
-        del os.environ['BRAINTRUST_API_KEY']
-    
-    tracker = BraintrustTracker()
-    assert tracker.enabled == False, "Tracker should be disabled without API key"
-    print("  ✅ Correctly disabled when no API key")
-    
-    # Restore key if it existed
-    if original_key:
-        os.environ['BRAINTRUST_API_KEY'] = original_key
+    # Test without API key. patch.dict restores the key even if the assertion fails, but it
+    # patches the process-wide os.environ, so this test must not run alongside others
+    with patch.dict(os.environ) as env:
+        env.pop('BRAINTRUST_API_KEY', None)
+        tracker = get_tracker()
+        assert tracker.enabled == False, "Tracker should be disabled without API key"
+        print("  ✅ Correctly disabled when no API key")
     
     print("✅ Braintrust setup test passed")
 
 def test_braintrust_tracker_mock():
     """Test BraintrustTracker with mock data"""
     print("🧪 Testing BraintrustTracker with mock data...")
+    from braintrust_integration import get_tracker
     
     # Create tracker (will be disabled without real API key)
-    tracker = BraintrustTracker("test-project")
+    tracker = get_tracker("test-project")
     
     # Test experiment start (should handle gracefully when disabled)
     experiment_id = tracker.start_experiment(
@@ -105,12 +123,10 @@ def test_config_loading():
     print("🧪 Testing config loading...")
     
     try:
-        import json
         config_path = Path("config/global_settings.json")
         
         if config_path.exists():
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+            config = _load_global_settings(str(config_path))
             
             braintrust_config = config.get('braintrust', {})
             assert braintrust_config.get('enabled') == True, "Braintrust should be enabled in config"
@@ -131,24 +147,24 @@ def main():
     print("🚀 Starting Braintrust Integration Tests")
     print("=" * 50)
     
+    # test_braintrust_setup patches the process-wide os.environ, so it runs on its own first
+    serial_tests = [test_braintrust_setup]
     tests = [
-        test_braintrust_setup,
         test_braintrust_tracker_mock,
         test_integration_import,
         test_config_loading
     ]
     
-    passed = 0
-    total = len(tests)
-    
-    for test_func in tests:
-        try:
-            test_func()
-            passed += 1
-            print()
-        except Exception as e:
-            print(f"❌ Test {test_func.__name__} failed: {e}")
-            print()
+    total = len(serial_tests) + len(tests)
+    passed = sum(_run_test(test_func) for test_func in serial_tests)
+    
+    # The remaining tests are independent, so run them concurrently and print each one's output as it finishes
+    with thread_buffered_stdout() as stdout, ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        futures = [executor.submit(run_buffered, _run_test, test_func) for test_func in tests]
+        for future in as_completed(futures):
+            ok, output = future.result()
+            passed += ok
+            stdout.write(output)
     
     print("=" * 50)
     print(f"Test Results: {passed}/{total} passed")
@@ -3,11 +3,12 @@
 Test script for GEPA integration
 """
 
+import os
 import sys
-from pathlib import Path
 
 # Add scripts directory to path
-sys.path.insert(0, str(Path(__file__).parent / "scripts"))
+_SCRIPTS = os.path.join(os.path.dirname(__file__), "scripts")
+sys.path.insert(0, _SCRIPTS)
 
 try:
     from gepa_adapter import GEPA_AVAILABLE, BlogPostDataInstance, BlogPostGEPAAdapter